@@ -46,8 +46,8 @@ class AioHTTPRequestAdapter(AsyncHTTPRequestAdapter):
     def query_params(self) -> QueryParams:
         return self.request.query.copy()  # type: ignore[attr-defined]
 
-    async def get_body(self) -> str:
-        return (await self.request.content.read()).decode()
+    async def get_body(self) -> bytes:
+        return await self.request.content.read()
 
     @property
     def method(self) -> HTTPMethod:
@@ -194,7 +194,7 @@ class GraphQLView(
         request: web.Request,
         stream: Callable[[], AsyncGenerator[str, None]],
         sub_response: web.Response,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
     ) -> web.StreamResponse:
         response = web.StreamResponse(
             status=sub_response.status,
@@ -7,7 +7,6 @@ from typing import (
     Any,
     AsyncIterator,
     Callable,
-    Dict,
     Mapping,
     Optional,
     Sequence,
@@ -227,7 +226,7 @@ class GraphQL(
         request: Request | WebSocket,
         stream: Callable[[], AsyncIterator[str]],
         sub_response: Response,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
     ) -> Response:
         return StreamingResponse(
             stream(),
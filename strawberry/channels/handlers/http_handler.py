@@ -278,7 +278,7 @@ class GraphQLHTTPConsumer(
         request: ChannelsRequest,
         stream: Callable[[], AsyncGenerator[str, None]],
         sub_response: TemporalResponse,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
     ) -> MultipartChannelsResponse:
         status = sub_response.status_code or 200
 
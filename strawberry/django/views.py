@@ -7,7 +7,6 @@ from typing import (
     Any,
     AsyncIterator,
     Callable,
-    Dict,
     Mapping,
     Optional,
     Union,
@@ -126,8 +125,8 @@ class AsyncDjangoHTTPRequestAdapter(AsyncHTTPRequestAdapter):
     def content_type(self) -> Optional[str]:
         return self.headers.get("Content-type")
 
-    async def get_body(self) -> str:
-        return self.request.body.decode()
+    async def get_body(self) -> bytes:
+        return self.request.body
 
     async def get_form_data(self) -> FormData:
         return FormData(
@@ -191,7 +190,7 @@ class BaseView:
         request: HttpRequest,
         stream: Callable[[], AsyncIterator[Any]],
         sub_response: TemporalHttpResponse,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
     ) -> HttpResponseBase:
         return StreamingHttpResponse(
             streaming_content=stream(),
@@ -145,8 +145,8 @@ class AsyncFlaskHTTPRequestAdapter(AsyncHTTPRequestAdapter):
     def headers(self) -> Mapping[str, str]:
         return self.request.headers
 
-    async def get_body(self) -> str:
-        return self.request.data.decode()
+    async def get_body(self) -> bytes:
+        return self.request.data
 
     async def get_form_data(self) -> FormData:
         return FormData(
@@ -1,16 +1,19 @@
 import abc
 import asyncio
 import contextlib
-import json
+from json import JSONDecodeError
+from types import MappingProxyType
 from typing import (
     Any,
     AsyncGenerator,
     Callable,
+    ClassVar,
     Dict,
     Generic,
     List,
     Mapping,
     Optional,
+    Set,
     Tuple,
     Union,
 )
@@ -30,7 +33,6 @@ from strawberry.http.ides import GraphQL_IDE
 from strawberry.schema.base import BaseSchema
 from strawberry.schema.exceptions import InvalidOperationTypeError
 from strawberry.types import ExecutionResult, SubscriptionExecutionResult
-from strawberry.types.graphql import OperationType
 
 from .base import BaseView
 from .exceptions import HTTPException
@@ -72,6 +74,17 @@ class AsyncBaseHTTPView(
     graphql_ide: Optional[GraphQL_IDE]
     request_adapter_class: Callable[[Request], AsyncHTTPRequestAdapter]
 
+    # seconds without a message after which a heartbeat is sent on
+    # multipart subscriptions
+    _HEARTBEAT_INTERVAL: ClassVar[float] = 5
+
+    _MULTIPART_SUBSCRIPTION_HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "Transfer-Encoding": "chunked",
+            "Content-Type": "multipart/mixed;boundary=graphql;subscriptionSpec=1.0,application/json",
+        }
+    )
+
     @property
     @abc.abstractmethod
     def allow_queries_via_get(self) -> bool: ...
@@ -98,27 +111,27 @@ class AsyncBaseHTTPView(
         request: Request,
         stream: Callable[[], AsyncGenerator[str, None]],
         sub_response: SubResponse,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
     ) -> Response:
         raise ValueError("Multipart responses are not supported")
 
     async def execute_operation(
-        self, request: Request, context: Context, root_value: Optional[RootValue]
+        self,
+        request_adapter: AsyncHTTPRequestAdapter,
+        context: Context,
+        root_value: Optional[RootValue],
     ) -> Union[ExecutionResult, SubscriptionExecutionResult]:
-        request_adapter = self.request_adapter_class(request)
-
         try:
             request_data = await self.parse_http_body(request_adapter)
-        except json.decoder.JSONDecodeError as e:
+        except JSONDecodeError as e:
             raise HTTPException(400, "Unable to parse request body as JSON") from e
             # DO this only when doing files
         except KeyError as e:
             raise HTTPException(400, "File(s) missing in form data") from e
 
-        allowed_operation_types = OperationType.from_http(request_adapter.method)
-
-        if not self.allow_queries_via_get and request_adapter.method == "GET":
-            allowed_operation_types = allowed_operation_types - {OperationType.QUERY}
+        allowed_operation_types = self._get_allowed_operation_types(
+            request_adapter.method, self.allow_queries_via_get
+        )
 
         assert self.schema
 
@@ -140,20 +153,23 @@ class AsyncBaseHTTPView(
             allowed_operation_types=allowed_operation_types,
         )
 
+    def _parse_form_field(self, value: Any) -> Any:
+        if value is None:
+            return {}
+
+        if isinstance(value, (bytes, str)):
+            return self.parse_json(value)
+
+        return value
+
     async def parse_multipart(self, request: AsyncHTTPRequestAdapter) -> Dict[str, str]:
         try:
             form_data = await request.get_form_data()
         except ValueError as e:
             raise HTTPException(400, "Unable to parse the multipart body") from e
 
-        operations = form_data["form"].get("operations", "{}")
-        files_map = form_data["form"].get("map", "{}")
-
-        if isinstance(operations, (bytes, str)):
-            operations = self.parse_json(operations)
-
-        if isinstance(files_map, (bytes, str)):
-            files_map = self.parse_json(files_map)
+        operations = self._parse_form_field(form_data["form"].get("operations"))
+        files_map = self._parse_form_field(form_data["form"].get("map"))
 
         try:
             return replace_placeholders_with_files(
@@ -185,20 +201,38 @@ class AsyncBaseHTTPView(
                 raise HTTPException(404, "Not Found")
 
         sub_response = await self.get_sub_response(request)
-        context = (
-            await self.get_context(request, response=sub_response)
-            if context is UNSET
-            else context
-        )
-        root_value = (
-            await self.get_root_value(request) if root_value is UNSET else root_value
-        )
+
+        if context is UNSET and root_value is UNSET:
+            # the root value doesn't depend on the context, so fetch it
+            # concurrently; the context is awaited in the current task so that
+            # any context variables set by get_context stay visible
+            root_value_task = asyncio.ensure_future(self.get_root_value(request))
+
+            try:
+                context = await self.get_context(request, response=sub_response)
+            except BaseException:
+                root_value_task.cancel()
+
+                with contextlib.suppress(Exception, asyncio.CancelledError):
+                    await root_value_task
+
+                raise
+
+            root_value = await root_value_task
+        else:
+            if context is UNSET:
+                context = await self.get_context(request, response=sub_response)
+
+            if root_value is UNSET:
+                root_value = await self.get_root_value(request)
 
         assert context
 
         try:
             result = await self.execute_operation(
-                request=request, context=context, root_value=root_value
+                request_adapter=request_adapter,
+                context=context,
+                root_value=root_value,
             )
         except InvalidOperationTypeError as e:
             raise HTTPException(
@@ -214,10 +248,7 @@ class AsyncBaseHTTPView(
                 request,
                 stream,
                 sub_response,
-                headers={
-                    "Transfer-Encoding": "chunked",
-                    "Content-Type": "multipart/mixed;boundary=graphql;subscriptionSpec=1.0,application/json",
-                },
+                headers=self._MULTIPART_SUBSCRIPTION_HEADERS,
             )
 
         response_data = await self.process_result(request=request, result=result)
@@ -230,67 +261,78 @@ class AsyncBaseHTTPView(
         )
 
     def encode_multipart_data(self, data: Any, separator: str) -> str:
-        return "".join(
-            [
-                f"\r\n--{separator}\r\n",
-                "Content-Type: application/json\r\n\r\n",
-                self.encode_json(data),
-                "\n",
-            ]
+        return (
+            f"\r\n--{separator}\r\n"
+            "Content-Type: application/json\r\n\r\n"
+            f"{self.encode_json(data)}\n"
         )
 
     def _stream_with_heartbeat(
         self, stream: Callable[[], AsyncGenerator[str, None]]
     ) -> Callable[[], AsyncGenerator[str, None]]:
         """Adds a heartbeat to the stream, to prevent the connection from closing when there are no messages being sent."""
-        queue: asyncio.Queue[Tuple[bool, Any]] = asyncio.Queue(1)
-
-        cancelling = False
-
-        async def drain() -> None:
-            try:
-                async for item in stream():
-                    await queue.put((False, item))
-            except Exception as e:
-                if not cancelling:
-                    await queue.put((True, e))
-                else:
-                    raise
-
-        async def heartbeat() -> None:
-            while True:
-                await queue.put((False, self.encode_multipart_data({}, "graphql")))
-
-                await asyncio.sleep(5)
+        heartbeat_frame = self.encode_multipart_data({}, "graphql")
 
         async def merged() -> AsyncGenerator[str, None]:
-            heartbeat_task = asyncio.create_task(heartbeat())
+            loop = asyncio.get_running_loop()
+            # drain hands the stream's items over one at a time, through the
+            # `item` future, and waits for `consumed` before pulling the next
+            # one, so that the subscription never runs ahead of the client
+            item: asyncio.Future[Tuple[bool, Any]] = loop.create_future()
+            consumed: asyncio.Future[None] = loop.create_future()
+
+            # the whole stream is consumed by a single task, so that context
+            # variables set by the subscription persist across its items
+            async def drain() -> None:
+                nonlocal consumed
+
+                source = stream()
+
+                try:
+                    async for data in source:
+                        consumed = loop.create_future()
+                        item.set_result((False, data))
+
+                        await consumed
+                except Exception as e:
+                    item.set_result((True, e))
+                finally:
+                    # the stream may be suspended at a yield when cancelled
+                    await source.aclose()
+
             task = asyncio.create_task(drain())
 
-            async def cancel_tasks() -> None:
-                nonlocal cancelling
-                cancelling = True
-                task.cancel()
+            try:
+                yield heartbeat_frame
 
-                with contextlib.suppress(asyncio.CancelledError):
-                    await task
+                while True:
+                    waitables: Set[asyncio.Future[Any]] = {item, task}
+                    done, _ = await asyncio.wait(
+                        waitables,
+                        timeout=self._HEARTBEAT_INTERVAL,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
 
-                heartbeat_task.cancel()
+                    if item.done():
+                        raised, data = item.result()
 
-                with contextlib.suppress(asyncio.CancelledError):
-                    await heartbeat_task
+                        if raised:
+                            raise data
 
-            try:
-                while not task.done():
-                    raised, data = await queue.get()
+                        item = loop.create_future()
 
-                    if raised:
-                        await cancel_tasks()
-                        raise data
+                        yield data
 
-                    yield data
+                        consumed.set_result(None)
+                    elif task.done():
+                        break
+                    elif not done:
+                        yield heartbeat_frame
             finally:
-                await cancel_tasks()
+                task.cancel()
+
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
 
         return merged
 
@@ -300,12 +342,17 @@ class AsyncBaseHTTPView(
         result: SubscriptionExecutionResult,
         separator: str = "graphql",
     ) -> Callable[[], AsyncGenerator[str, None]]:
+        closing_frame = f"\r\n--{separator}--\r\n"
+
         async def stream() -> AsyncGenerator[str, None]:
+            process = self.process_result
+            encode = self.encode_multipart_data
+
             async for value in result:
-                response = await self.process_result(request, value)
-                yield self.encode_multipart_data({"payload": response}, separator)
+                response = await process(request, value)
+                yield encode({"payload": response}, separator)
 
-            yield f"\r\n--{separator}--\r\n"
+            yield closing_frame
 
         return self._stream_with_heartbeat(stream)
 
@@ -321,20 +368,22 @@ class AsyncBaseHTTPView(
         self, request: AsyncHTTPRequestAdapter
     ) -> GraphQLRequestData:
         content_type, params = parse_content_type(request.content_type or "")
+        is_multipart_subscription = self._is_multipart_subscriptions(
+            content_type, params
+        )
 
-        protocol: Literal["http", "multipart-subscription"] = "http"
+        protocol: Literal["http", "multipart-subscription"] = (
+            "multipart-subscription" if is_multipart_subscription else "http"
+        )
 
         if request.method == "GET":
             data = self.parse_query_params(request.query_params)
-            if self._is_multipart_subscriptions(content_type, params):
-                protocol = "multipart-subscription"
         elif "application/json" in content_type:
             data = self.parse_json(await request.get_body())
         elif content_type == "multipart/form-data":
             data = await self.parse_multipart(request)
-        elif self._is_multipart_subscriptions(content_type, params):
+        elif is_multipart_subscription:
             data = await self.parse_multipart_subscriptions(request)
-            protocol = "multipart-subscription"
         else:
             raise HTTPException(400, "Unsupported content type")
 
@@ -1,14 +1,52 @@
 import json
-from typing import Any, Dict, Generic, List, Mapping, Optional, Union
+from typing import (
+    AbstractSet,
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 from typing_extensions import Protocol
 
 from strawberry.http import GraphQLHTTPResponse
 from strawberry.http.ides import GraphQL_IDE, get_graphql_ide_html
 from strawberry.http.types import HTTPMethod, QueryParams
+from strawberry.types.graphql import OperationType
 
 from .exceptions import HTTPException
 from .typevars import Request
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+if orjson is not None:
+    # let the types the stdlib can't encode fall back to it, so that they
+    # keep raising a TypeError instead of being encoded by orjson
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    _loads = orjson.loads
+
+    def _dumps(data: Any) -> str:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # orjson is stricter than the stdlib (e.g. integers larger than
+            # 64 bits or non-string keys), so fall back for those payloads
+            return json.dumps(data)
+
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
 
 class BaseRequestProtocol(Protocol):
     @property
@@ -28,27 +66,49 @@ class BaseView(Generic[Request]):
     _ide_replace_variables: bool = True
     _ide_subscription_enabled: bool = True
 
-    def should_render_graphql_ide(self, request: BaseRequestProtocol) -> bool:
-        return (
-            request.method == "GET"
-            and request.query_params.get("query") is None
-            and any(
-                supported_header in request.headers.get("accept", "")
-                for supported_header in ("text/html", "*/*")
-            )
+    # allowed operation types keyed by (http method, allow_queries_via_get)
+    _ALLOWED_OPERATION_TYPES: ClassVar[
+        Mapping[Tuple[str, bool], FrozenSet[OperationType]]
+    ] = {
+        ("GET", True): frozenset(OperationType.from_http("GET")),
+        ("GET", False): frozenset(OperationType.from_http("GET"))
+        - {OperationType.QUERY},
+        ("POST", True): frozenset(OperationType.from_http("POST")),
+        ("POST", False): frozenset(OperationType.from_http("POST")),
+    }
+
+    def _get_allowed_operation_types(
+        self, method: HTTPMethod, allow_queries_via_get: bool
+    ) -> AbstractSet[OperationType]:
+        allowed_operation_types = self._ALLOWED_OPERATION_TYPES.get(
+            (method, bool(allow_queries_via_get))
         )
 
+        if allowed_operation_types is None:
+            # methods allowed by a custom is_request_allowed
+            return OperationType.from_http(method)
+
+        return allowed_operation_types
+
+    def should_render_graphql_ide(self, request: BaseRequestProtocol) -> bool:
+        if request.method != "GET" or request.query_params.get("query") is not None:
+            return False
+
+        accept = request.headers.get("accept", "")
+
+        return "text/html" in accept or "*/*" in accept
+
     def is_request_allowed(self, request: BaseRequestProtocol) -> bool:
         return request.method in ("GET", "POST")
 
     def parse_json(self, data: Union[str, bytes]) -> Any:
         try:
-            return json.loads(data)
+            return _loads(data)
         except json.JSONDecodeError as e:
             raise HTTPException(400, "Unable to parse request body as JSON") from e
 
     def encode_json(self, response_data: GraphQLHTTPResponse) -> str:
-        return json.dumps(response_data)
+        return _dumps(response_data)
 
     def parse_query_params(self, params: QueryParams) -> Dict[str, Any]:
         params = dict(params)
@@ -70,7 +130,7 @@ class BaseView(Generic[Request]):
         )
 
     def _is_multipart_subscriptions(
-        self, content_type: str, params: Dict[str, str]
+        self, content_type: str, params: Mapping[str, str]
     ) -> bool:
         if content_type != "multipart/mixed":
             return False
@@ -1,16 +1,90 @@
+import functools
 from email.message import Message
-from typing import Dict, Tuple
+from email.utils import collapse_rfc2231_value
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 
+_EMPTY_PARAMS: Mapping[str, str] = MappingProxyType({})
 
-def parse_content_type(content_type: str) -> Tuple[str, Dict[str, str]]:
-    """Parse a content type header into a mime-type and a dictionary of parameters."""
-    email = Message()
-    email["content-type"] = content_type
 
-    params = email.get_params()
+def _split_params(params: str) -> List[str]:
+    """Split parameters on `;`, ignoring the ones inside quoted strings."""
+    if '"' not in params:
+        return params.split(";")
+
+    parts: List[str] = []
+    start = 0
+    in_quotes = False
+    escaped = False
+
+    for index, char in enumerate(params):
+        if escaped:
+            escaped = False
+        elif char == "\\" and in_quotes:
+            escaped = True
+        elif char == '"':
+            in_quotes = not in_quotes
+        elif char == ";" and not in_quotes:
+            parts.append(params[start:index])
+            start = index + 1
+
+    parts.append(params[start:])
+
+    return parts
+
+
+def _parse_params(params: str) -> Mapping[str, str]:
+    parsed = {}
+
+    for param in _split_params(params):
+        name, _, value = param.partition("=")
+        name = name.strip().lower()
+
+        if not name:
+            continue
+
+        value = value.strip()
+
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+
+        parsed[name] = value
+
+    return MappingProxyType(parsed)
+
+
+def _parse_extended_params(content_type: str) -> Mapping[str, str]:
+    """Parse parameters using RFC 2231 extensions, such as `charset*=utf-8''%E2%82%AC`.
+
+    These are rare enough that we leave them to the email package.
+    """
+    message = Message()
+    message["content-type"] = content_type
+
+    params = message.get_params()
 
     assert params
 
-    mime_type, _ = params.pop(0)
+    return MappingProxyType(
+        {name: collapse_rfc2231_value(value) for name, value in params[1:]}
+    )
+
+
+# Content type headers have a very low cardinality in practice, but multipart
+# bodies carry a random boundary, hence a bounded cache
+@functools.lru_cache(maxsize=64)
+def parse_content_type(content_type: str) -> Tuple[str, Mapping[str, str]]:
+    """Parse a content type header into a mime-type and a mapping of parameters.
+
+    The mime-type and parameter names are lowercased, as they are case-insensitive.
+    """
+    mime_type, _, params = content_type.partition(";")
+    mime_type = mime_type.strip().lower()
+
+    if not params:
+        return mime_type, _EMPTY_PARAMS
+
+    if "*" in params:
+        return mime_type, _parse_extended_params(content_type)
 
-    return mime_type, dict(params)
+    return mime_type, _parse_params(params)
@@ -1,5 +1,5 @@
 import abc
-import json
+from json import JSONDecodeError
 from typing import (
     Any,
     Callable,
@@ -25,7 +25,6 @@ from strawberry.http.ides import GraphQL_IDE
 from strawberry.schema import BaseSchema
 from strawberry.schema.exceptions import InvalidOperationTypeError
 from strawberry.types import ExecutionResult
-from strawberry.types.graphql import OperationType
 
 from .base import BaseView
 from .exceptions import HTTPException
@@ -98,22 +97,22 @@ class SyncBaseHTTPView(
     def render_graphql_ide(self, request: Request) -> Response: ...
 
     def execute_operation(
-        self, request: Request, context: Context, root_value: Optional[RootValue]
+        self,
+        request_adapter: SyncHTTPRequestAdapter,
+        context: Context,
+        root_value: Optional[RootValue],
     ) -> ExecutionResult:
-        request_adapter = self.request_adapter_class(request)
-
         try:
             request_data = self.parse_http_body(request_adapter)
-        except json.decoder.JSONDecodeError as e:
+        except JSONDecodeError as e:
             raise HTTPException(400, "Unable to parse request body as JSON") from e
             # DO this only when doing files
         except KeyError as e:
             raise HTTPException(400, "File(s) missing in form data") from e
 
-        allowed_operation_types = OperationType.from_http(request_adapter.method)
-
-        if not self.allow_queries_via_get and request_adapter.method == "GET":
-            allowed_operation_types = allowed_operation_types - {OperationType.QUERY}
+        allowed_operation_types = self._get_allowed_operation_types(
+            request_adapter.method, self.allow_queries_via_get
+        )
 
         assert self.schema
 
@@ -192,7 +191,7 @@ class SyncBaseHTTPView(
 
         try:
             result = self.execute_operation(
-                request=request,
+                request_adapter=request_adapter,
                 context=context,
                 root_value=root_value,
             )
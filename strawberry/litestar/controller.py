@@ -285,7 +285,7 @@ class GraphQLController(
         request: Request,
         stream: Callable[[], AsyncIterator[str]],
         sub_response: Response,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
     ) -> Response:
         return Stream(
             stream(),
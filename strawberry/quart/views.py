@@ -1,6 +1,6 @@
 import warnings
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, AsyncGenerator, Callable, Dict, Optional, cast
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Optional, cast
 
 from quart import Request, Response, request
 from quart.views import View
@@ -36,8 +36,8 @@ class QuartHTTPRequestAdapter(AsyncHTTPRequestAdapter):
     def headers(self) -> Mapping[str, str]:
         return self.request.headers
 
-    async def get_body(self) -> str:
-        return (await self.request.data).decode()
+    async def get_body(self) -> bytes:
+        return await self.request.data
 
     async def get_form_data(self) -> FormData:
         files = await self.request.files
@@ -108,7 +108,7 @@ class GraphQLView(
         request: Request,
         stream: Callable[[], AsyncGenerator[str, None]],
         sub_response: Response,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
     ) -> Response:
         return (
             stream(),
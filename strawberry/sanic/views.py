@@ -59,8 +59,8 @@ class SanicHTTPRequestAdapter(AsyncHTTPRequestAdapter):
     def content_type(self) -> Optional[str]:
         return self.request.content_type
 
-    async def get_body(self) -> str:
-        return self.request.body.decode()
+    async def get_body(self) -> bytes:
+        return self.request.body
 
     async def get_form_data(self) -> FormData:
         assert self.request.form is not None
@@ -183,7 +183,7 @@ class GraphQLView(
         request: Request,
         stream: Callable[[], AsyncGenerator[str, None]],
         sub_response: TemporalResponse,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
     ) -> HTTPResponse:
         response = await self.request.respond(
             status=sub_response.status_code,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Optional
 
 import pytest
@@ -31,3 +32,68 @@ def test_simple_query(test_client: TestClient):
     response = test_client.post("/", json={"query": "{ hello }"})
 
     assert response.json() == {"data": {"hello": "Hello world"}}
+
+
+def test_context_and_root_value_are_fetched_concurrently():
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.testclient import TestClient
+
+    from strawberry.asgi import GraphQL
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hello(self) -> str:
+            return "Hello world"
+
+    class ConcurrentGraphQL(GraphQL):
+        async def get_sub_response(self, request: Request) -> Response:
+            # created here so that they belong to the request's event loop
+            self.context_started = asyncio.Event()
+            self.root_value_started = asyncio.Event()
+
+            return await super().get_sub_response(request)
+
+        async def get_root_value(self, request: Request) -> Query:
+            self.root_value_started.set()
+
+            # times out if get_context is only called afterwards
+            await asyncio.wait_for(self.context_started.wait(), timeout=1)
+
+            return Query()
+
+        async def get_context(self, request: Request, response: Response) -> dict:
+            self.context_started.set()
+
+            # times out if get_root_value is only called afterwards
+            await asyncio.wait_for(self.root_value_started.wait(), timeout=1)
+
+            return await super().get_context(request, response)
+
+    app = ConcurrentGraphQL(strawberry.Schema(Query))
+    response = TestClient(app).post("/", json={"query": "{ hello }"})
+
+    assert response.json() == {"data": {"hello": "Hello world"}}
+
+
+def test_methods_allowed_by_a_custom_view_use_the_http_operation_types():
+    from starlette.testclient import TestClient
+
+    from strawberry.asgi import GraphQL
+    from strawberry.http.base import BaseRequestProtocol
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hello(self) -> str:
+            return "Hello world"
+
+    class PutGraphQL(GraphQL):
+        def is_request_allowed(self, request: BaseRequestProtocol) -> bool:
+            return request.method in ("GET", "POST", "PUT")
+
+    app = PutGraphQL(strawberry.Schema(Query))
+
+    with pytest.raises(ValueError, match="Unsupported HTTP method: PUT"):
+        TestClient(app).put("/", json={"query": "{ hello }"})
@@ -11,3 +11,17 @@ async def test_does_only_allow_get_and_post(
     response = await http_client.request(url="/graphql", method=method)  # type: ignore
 
     assert response.status_code == 405
+
+
+@pytest.mark.parametrize(
+    "content_type", ["application/json", "Application/JSON; charset=utf-8"]
+)
+async def test_accepts_json_content_type(content_type: str, http_client: HttpClient):
+    response = await http_client.post(
+        url="/graphql",
+        data=b'{"query": "{ hello }"}',
+        headers={"content-type": content_type},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
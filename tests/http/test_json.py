@@ -0,0 +1,110 @@
+import dataclasses
+import datetime
+import enum
+import json
+import math
+import uuid
+
+import pytest
+
+from strawberry.http import base
+from strawberry.http.base import BaseView
+from strawberry.http.exceptions import HTTPException
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    if request.param == "orjson":
+        if base.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(base, "_loads", json.loads)
+        monkeypatch.setattr(base, "_dumps", json.dumps)
+
+    return request.param
+
+
+@pytest.mark.parametrize("data", ['{"query": "{ hello }"}', b'{"query": "{ hello }"}'])
+def test_parse_json(json_backend: str, data):
+    assert BaseView().parse_json(data) == {"query": "{ hello }"}
+
+
+def test_parse_json_raises_http_exception_on_invalid_json(json_backend: str):
+    with pytest.raises(HTTPException) as exc_info:
+        BaseView().parse_json(b"{")
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.reason == "Unable to parse request body as JSON"
+
+
+@pytest.mark.parametrize("data", [b'{"value": NaN}', b'{"value": Infinity}'])
+def test_parse_json_with_non_finite_numbers(json_backend: str, data: bytes):
+    if json_backend == "stdlib":
+        assert not math.isfinite(BaseView().parse_json(data)["value"])
+    else:
+        # orjson only accepts strict JSON
+        with pytest.raises(HTTPException) as exc_info:
+            BaseView().parse_json(data)
+
+        assert exc_info.value.status_code == 400
+
+
+def test_encode_json(json_backend: str):
+    data = {"data": {"hello": "world", "count": 1}}
+
+    assert json.loads(BaseView().encode_json(data)) == data
+
+
+def test_encode_json_with_big_integers(json_backend: str):
+    data = {"data": {"big": 2**70}}
+
+    assert json.loads(BaseView().encode_json(data)) == data
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize(
+    "value", [datetime.datetime(2024, 1, 1), datetime.date(2024, 1, 1), Point(1, 2)]
+)
+def test_encode_json_rejects_non_json_types(json_backend: str, value):
+    with pytest.raises(TypeError):
+        BaseView().encode_json({"data": {"value": value}})
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (uuid.UUID(int=1), "00000000-0000-0000-0000-000000000001"),
+        (Color.RED, "red"),
+    ],
+)
+def test_encode_json_with_types_only_orjson_supports(
+    json_backend: str, value, expected: str
+):
+    data = {"data": {"value": value}}
+
+    if json_backend == "stdlib":
+        with pytest.raises(TypeError):
+            BaseView().encode_json(data)
+    else:
+        assert json.loads(BaseView().encode_json(data)) == {"data": {"value": expected}}
+
+
+def test_encode_json_with_non_finite_numbers(json_backend: str):
+    encoded = BaseView().encode_json({"data": {"value": math.nan}})
+
+    if json_backend == "stdlib":
+        assert encoded == '{"data": {"value": NaN}}'
+    else:
+        # orjson only produces strict JSON
+        assert encoded == '{"data":{"value":null}}'
@@ -40,6 +40,23 @@ from strawberry.http.parse_content_type import parse_content_type
                 },
             ),
         ),
+        ("Application/JSON; Charset=UTF-8", ("application/json", {"charset": "UTF-8"})),
+        (
+            'multipart/form-data; boundary="foo;bar"',
+            ("multipart/form-data", {"boundary": "foo;bar"}),
+        ),
+        (
+            'text/plain; name="a \\"quoted\\" value"',
+            ("text/plain", {"name": 'a "quoted" value'}),
+        ),
+        (
+            "text/plain; charset*=utf-8''%E2%82%AC",
+            ("text/plain", {"charset": "\u20ac"}),
+        ),
+        (
+            "text/plain; title*0=foo; title*1=bar; charset=utf-8",
+            ("text/plain", {"title": "foobar", "charset": "utf-8"}),
+        ),
     ],
 )
 async def test_parse_content_type(
@@ -3,8 +3,10 @@ from __future__ import annotations
 from typing_extensions import Literal
 
 import pytest
+from graphql import GraphQLError
 
 from strawberry.http import GraphQLHTTPResponse
+from strawberry.http import process_result as default_process_result
 from strawberry.types import ExecutionResult
 
 from .clients.base import HttpClient
@@ -33,3 +35,23 @@ async def test_custom_process_result(
         query="{ hello }",
     )
     assert response.json["data"] == {"HELLO": "Hello world"}
+
+
+def test_default_process_result_only_includes_data_on_success():
+    result = ExecutionResult(data={"hello": "world"}, errors=None)
+
+    assert default_process_result(result) == {"data": {"hello": "world"}}
+
+
+def test_default_process_result_includes_errors_and_extensions():
+    result = ExecutionResult(
+        data=None,
+        errors=[GraphQLError("Something went wrong")],
+        extensions={"example": "example"},
+    )
+
+    assert default_process_result(result) == {
+        "data": None,
+        "errors": [{"message": "Something went wrong"}],
+        "extensions": {"example": "example"},
+    }
@@ -1,3 +1,7 @@
+from typing import Optional
+
+import pytest
+
 from .clients.base import HttpClient
 
 
@@ -35,8 +39,13 @@ async def test_does_not_allow_mutation(http_client: HttpClient):
     assert "mutations are not allowed when using GET" in response.text
 
 
-async def test_fails_if_allow_queries_via_get_false(http_client_class):
-    http_client = http_client_class(allow_queries_via_get=False)
+@pytest.mark.parametrize("allow_queries_via_get", [False, None])
+async def test_fails_if_allow_queries_via_get_false(
+    http_client_class, allow_queries_via_get: Optional[bool]
+):
+    http_client = http_client_class(
+        allow_queries_via_get=allow_queries_via_get  # type: ignore
+    )
 
     response = await http_client.query(method="get", query="{ hello }")
 
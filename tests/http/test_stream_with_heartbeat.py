@@ -0,0 +1,135 @@
+import asyncio
+import contextvars
+from typing import AsyncGenerator
+
+import pytest
+
+from strawberry.asgi import GraphQL
+from tests.views.schema import schema
+
+
+@pytest.fixture()
+def view() -> GraphQL:
+    return GraphQL(schema)
+
+
+async def test_stream_with_heartbeat_yields_all_items(view: GraphQL):
+    async def stream() -> AsyncGenerator[str, None]:
+        yield "first"
+        yield "second"
+
+    heartbeat = view.encode_multipart_data({}, "graphql")
+
+    items = [item async for item in view._stream_with_heartbeat(stream)()]
+
+    assert [item for item in items if item != heartbeat] == ["first", "second"]
+
+
+async def test_stream_with_heartbeat_starts_with_a_heartbeat(view: GraphQL):
+    async def stream() -> AsyncGenerator[str, None]:
+        yield "first"
+
+    heartbeat = view.encode_multipart_data({}, "graphql")
+
+    items = [item async for item in view._stream_with_heartbeat(stream)()]
+
+    assert items == [heartbeat, "first"]
+
+
+async def test_stream_with_heartbeat_propagates_errors(view: GraphQL):
+    async def stream() -> AsyncGenerator[str, None]:
+        yield "first"
+        raise ValueError("boom")
+
+    merged = view._stream_with_heartbeat(stream)()
+
+    with pytest.raises(ValueError, match="boom"):
+        async for _ in merged:
+            pass
+
+
+async def test_stream_with_heartbeat_sends_heartbeats_while_idle(view: GraphQL):
+    view._HEARTBEAT_INTERVAL = 0.01
+
+    async def stream() -> AsyncGenerator[str, None]:
+        await asyncio.sleep(0.1)
+        yield "first"
+
+    heartbeat = view.encode_multipart_data({}, "graphql")
+
+    items = [item async for item in view._stream_with_heartbeat(stream)()]
+
+    assert items[-1] == "first"
+    assert items.count(heartbeat) > 1
+
+
+async def test_stream_with_heartbeat_closes_stream_when_consumer_stops(
+    view: GraphQL,
+):
+    closed = False
+
+    async def stream() -> AsyncGenerator[str, None]:
+        nonlocal closed
+
+        try:
+            yield "first"
+            await asyncio.sleep(10)
+            yield "second"
+        finally:
+            closed = True
+
+    merged = view._stream_with_heartbeat(stream)()
+
+    assert await merged.__anext__() == view.encode_multipart_data({}, "graphql")
+    assert await merged.__anext__() == "first"
+
+    await merged.aclose()
+
+    assert closed
+
+
+async def test_stream_with_heartbeat_waits_for_the_consumer(view: GraphQL):
+    produced = 0
+
+    async def stream() -> AsyncGenerator[str, None]:
+        nonlocal produced
+
+        while True:
+            await asyncio.sleep(0)
+
+            produced += 1
+            yield str(produced)
+
+    merged = view._stream_with_heartbeat(stream)()
+
+    assert await merged.__anext__() == view.encode_multipart_data({}, "graphql")
+
+    for consumed in range(1, 51):
+        assert await merged.__anext__() == str(consumed)
+
+        # a slow client, giving the stream plenty of time to run ahead
+        await asyncio.sleep(0.001)
+
+        assert produced <= consumed + 1
+
+    await merged.aclose()
+
+    assert produced <= 51
+
+
+async def test_stream_with_heartbeat_keeps_context_across_items(view: GraphQL):
+    var: contextvars.ContextVar[str] = contextvars.ContextVar("var", default="unset")
+
+    async def stream() -> AsyncGenerator[str, None]:
+        var.set("set-in-first-step")
+        yield "first"
+        yield var.get()
+
+    heartbeat = view.encode_multipart_data({}, "graphql")
+
+    items = [item async for item in view._stream_with_heartbeat(stream)()]
+
+    assert [item for item in items if item != heartbeat] == [
+        "first",
+        "set-in-first-step",
+    ]